@@ -1,14 +1,53 @@
 import asyncio
-import csv
+import functools
+import hashlib
+from collections import Counter, OrderedDict, defaultdict
 import json
-import requests
+import httpx
+import numpy as np
+import pandas as pd
+from cachetools import TTLCache
 import os
-from flask import Flask, request, jsonify
+import uvicorn
+from contextlib import asynccontextmanager
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
 from dotenv import load_dotenv
 from mcp_agent.core.fastagent import FastAgent
 
-# Initialize Flask app
-app = Flask(__name__)
+try:
+    from numba import njit
+except ImportError:  # numba is an optional accelerator
+    njit = None
+
+# Shared async HTTP client so concurrent fetches reuse pooled keep-alive
+# connections instead of paying a TCP/TLS handshake per room member. Created
+# lazily and bound to the running loop: a kept-alive connection must never be
+# reused under a different event loop (that surfaces as "RuntimeError: Event
+# loop is closed" if the app is ever driven by short-lived loops).
+_http_client = None
+_http_client_loop = None
+
+def _get_http_client():
+    global _http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_client_loop is not loop:
+        _http_client = httpx.AsyncClient(
+            timeout=5,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+        )
+        _http_client_loop = loop
+    return _http_client
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    if _http_client is not None and _http_client_loop is asyncio.get_running_loop():
+        await _http_client.aclose()
+
+# Initialize FastAPI app; orjson serializes the nested bottle payloads in C
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 # Load environment variables
 load_dotenv()
@@ -16,34 +55,27 @@ load_dotenv()
 # Initialize FastAgent
 fast = FastAgent("LiquorRecommender")
 
-# Define agents with OpenAI GPT models
-@fast.agent(
-    "analyze_bar_profile",
-    instruction="Analyze user bar to extract key taste preferences, focusing on spirit types, ABV, and price range.",
-    model="gpt-4o-mini"
-)
+# Define agents with OpenAI GPT models. The bar profile is already structured
+# by analyze_user_bar, so no LLM "analysis" step is needed before recommending.
 @fast.agent(
     "enhanced_recommender",
-    instruction="Recommend 5 bottles based on user preferences (favorite spirit and ABV). Provide convincing reasons why each bottle matches the user's taste profile. Use pre-filtered candidates and ensure recommendations are unique.",
+    instruction="Recommend 5 bottles based on user preferences (favorite spirit and ABV). Provide convincing reasons why each bottle matches the user's taste profile. Use pre-filtered candidates and ensure recommendations are unique. Respond with ONLY valid JSON, no prose or code fences: { \"bottles\": [{\"name\": ..., \"reason\": ...}] }. Keep reasons concise and convincing.",
     model="gpt-4o"
 )
-@fast.agent(
-    "format_recommendations",
-    instruction="Format the top 5 recommendations in JSON: { bottles: [{name, reason}] }. Ensure reasons are concise and convincing, explaining why each bottle suits the user.",
-    model="gpt-4o-mini"
-)
-
-# Define the agent chain
-@fast.chain(
-    name="LiquorBartender",
-    sequence=[
-        "analyze_bar_profile",
-        "enhanced_recommender",
-        "format_recommendations"
-    ]
-)
 
 # Helper functions
+def parse_recommendations(recommendations):
+    """Extract the {bottles: [{name, reason}]} payload from the recommender output."""
+    if isinstance(recommendations, dict):
+        return recommendations
+    text = str(recommendations).strip()
+    # Tolerate a fenced block despite the instruction
+    if text.startswith("```"):
+        text = text.strip("`").strip()
+        if text.startswith("json"):
+            text = text[4:]
+    return json.loads(text)
+
 def analyze_user_bar(user_bar):
     """Analyze the user's bar to create a summary profile."""
     if not user_bar:
@@ -81,56 +113,122 @@ def analyze_user_bar(user_bar):
     min_price = min(prices) if prices else 30.0
     max_price = max(prices) if prices else 30.0
     
-    # Count spirits and brands using dictionary comprehension
-    spirit_counts = {}
-    for spirit in spirits:
-        spirit_counts[spirit] = spirit_counts.get(spirit, 0) + 1
-    
-    brand_counts = {}
-    for brand in brands:
-        brand_counts[brand] = brand_counts.get(brand, 0) + 1
-    
-    favorite_spirits = sorted(spirit_counts.items(), key=lambda x: x[1], reverse=True)
-    favorite_brands = sorted(brand_counts.items(), key=lambda x: x[1], reverse=True)
-    
+    # Count spirits and brands in C via Counter; most_common sorts by frequency
+    spirit_counts = Counter(spirits)
+    brand_counts = Counter(brands)
+
+    favorite_spirits = [spirit for spirit, _ in spirit_counts.most_common()]
+    favorite_brands = [brand for brand, _ in brand_counts.most_common()]
+
     return {
         'avg_proof': avg_proof,
         'proof_range': [min_proof, max_proof],
         'price_range': [min_price, max_price],
         'spirits': list(spirit_counts.keys()),
-        'favorite_spirits': [s[0] for s in favorite_spirits] if favorite_spirits else ['whiskey'],
-        'favorite_brands': [b[0] for b in favorite_brands] if favorite_brands else ['Jameson']
+        'favorite_spirits': favorite_spirits if favorite_spirits else ['whiskey'],
+        'favorite_brands': favorite_brands if favorite_brands else ['Jameson']
     }
 
-def prefilter_liquors(dataset, favorite_spirit, target_abv, max_candidates=20):
-    """Filter the dataset to get candidates matching the user's favorite spirit and ABV."""
-    scored = []
+# Columnar (SoA) views of the dataset, built once so the vectorized prefilter
+# never re-parses row dicts on the request path. A single (dataset, columns)
+# memo checked by identity on the stored object: the dataset is the
+# process-wide singleton from the lru_cached loader, and unlike an id()-keyed
+# dict this can neither grow without bound nor alias a recycled id.
+_column_memo = (None, None)
+
+def _liquor_columns(dataset):
+    """Build numpy columns (abv, price, lowercased spirit) for valid rows,
+    an index from lowercased spirit to the row positions holding it, and a
+    name -> row mapping for O(1) bottle lookups."""
+    global _column_memo
+    memo_dataset, cached = _column_memo
+    if memo_dataset is dataset:
+        return cached
+
+    rows, abvs, prices, spirits = [], [], [], []
+    spirit_index = defaultdict(list)
     for item in dataset:
-        score = 0
         try:
-            item_abv = float(item["abv"])
-            item_spirit = item["spirit_type"]
-            item_price = float(item["shelf_price"])
-            if target_abv - 5 <= item_abv <= target_abv + 5:
+            abv = float(item["abv"])
+            price = float(item["shelf_price"])
+            spirit = item["spirit_type"].lower()
+        except (ValueError, KeyError):
+            continue
+        spirit_index[spirit].append(len(rows))
+        rows.append(item)
+        abvs.append(abv)
+        prices.append(price)
+        spirits.append(spirit)
+
+    columns = (
+        rows,
+        np.asarray(abvs, dtype=np.float32),
+        np.asarray(prices, dtype=np.float32),
+        np.asarray(spirits),
+        {spirit: np.asarray(idx) for spirit, idx in spirit_index.items()},
+        {item['name']: item for item in dataset if 'name' in item},
+    )
+    _column_memo = (dataset, columns)
+    return columns
+
+def _score_rows_numpy(abv, spirit_match, price, target_abv):
+    """Vectorized scoring fallback when numba is unavailable."""
+    return (2 * ((abv >= target_abv - 5) & (abv <= target_abv + 5))
+            + 3 * spirit_match
+            + (price <= 100))
+
+if njit is not None:
+    # Fused single pass over the columns: no intermediate mask arrays, each
+    # column's bytes are touched exactly once.
+    @njit(cache=True, fastmath=True)
+    def _score_rows(abv, spirit_match, price, target_abv):
+        n = abv.shape[0]
+        out = np.empty(n, np.int8)
+        for i in range(n):
+            score = 0
+            if target_abv - 5 <= abv[i] <= target_abv + 5:
                 score += 2
-            if favorite_spirit.lower() == item_spirit.lower():
+            if spirit_match[i]:
                 score += 3
-            if item_price <= 100:
+            if price[i] <= 100:
                 score += 1
-            scored.append((score, item))
-        except (ValueError, KeyError):
-            continue
-    scored.sort(key=lambda x: x[0], reverse=True)
-    return [item for _, item in scored[:max_candidates]]
+            out[i] = score
+        return out
+else:
+    _score_rows = _score_rows_numpy
 
+def prefilter_liquors(dataset, favorite_spirit, target_abv, max_candidates=20):
+    """Filter the dataset to get candidates matching the user's favorite spirit and ABV."""
+    rows, abv, price, spirit, spirit_index, _ = _liquor_columns(dataset)
+    if not rows:
+        return []
+
+    # Matching spirit dominates the score, so when the index holds enough rows
+    # of the favorite spirit only those need scoring; fall back to the full
+    # catalog when the spirit is rare or unknown.
+    matched = spirit_index.get(favorite_spirit.lower())
+    if matched is not None and len(matched) >= max_candidates:
+        candidates = matched
+    else:
+        candidates = np.arange(len(rows))
+
+    spirit_match = spirit[candidates] == favorite_spirit.lower()
+    score = _score_rows(abv[candidates], spirit_match, price[candidates], float(target_abv))
+    k = min(max_candidates, len(candidates))
+    # O(N) partition to isolate the top k, then sort only those k rows
+    top = np.argpartition(-score, k - 1)[:k]
+    top = top[np.argsort(-score[top], kind="stable")]
+    return [rows[i] for i in candidates[top]]
+
+@functools.lru_cache(maxsize=1)
 def load_liquor_dataset():
-    """Load liquor dataset from CSV or use fallback."""
-    dataset = []
+    """Load liquor dataset from CSV or use fallback. Cached after the first call
+    so the hot request path never re-reads or re-parses the CSV."""
     try:
-        with open('liquors.csv', mode="r", newline="") as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                dataset.append(row)
+        df = pd.read_csv('liquors.csv', dtype={'abv': 'float32',
+                                               'shelf_price': 'float32',
+                                               'spirit_type': 'category'})
+        dataset = df.to_dict('records')
     except FileNotFoundError:
         print("Error: liquors.csv not found. Using sample dataset.")
         dataset = [
@@ -143,18 +241,102 @@ def load_liquor_dataset():
         ]
     return dataset
 
+# Exact-match cache for agent outputs. The GPT calls dominate latency and
+# cost, and identical profile/candidate inputs are common across requests.
+_agent_cache = OrderedDict()
+_AGENT_CACHE_MAX = 256
+
+async def _cached_agent_call(agent_name, call, *inputs, parse=None):
+    """Invoke an agent, reusing the cached result for identical inputs.
+
+    When a parse callable is given, the raw output is validated through it
+    before being cached: a malformed reply raises here and is never pinned,
+    so the next request with the same inputs retries the model."""
+    payload = json.dumps({"agent": agent_name, "inputs": inputs},
+                         sort_keys=True, default=str)
+    key = hashlib.sha256(payload.encode()).hexdigest()
+    if key in _agent_cache:
+        _agent_cache.move_to_end(key)
+        return _agent_cache[key]
+    result = await call(*inputs)
+    if parse is not None:
+        result = parse(result)
+    _agent_cache[key] = result
+    if len(_agent_cache) > _AGENT_CACHE_MAX:
+        _agent_cache.popitem(last=False)
+    return result
+
+# Served when BAXUS is unreachable; a transient failure must not be cached
+# as the user's real profile.
+_FALLBACK_USER_BAR = [
+    {"product": {"name": "Jameson", "proof": 80, "average_msrp": 30, "brand": "Jameson", "spirit": "whiskey"}}
+]
+
 async def fetch_user_bar(username: str):
-    """Fetch user bar data from API or use fallback."""
+    """Fetch user bar data from API; returns None when the fetch fails."""
     user_bar_url = f"http://services.baxus.co/api/bar/user/{username}"
     try:
-        response = requests.get(user_bar_url, timeout=5)
+        response = await _get_http_client().get(user_bar_url)
         response.raise_for_status()
         return response.json()
-    except requests.RequestException as e:
+    except (httpx.HTTPError, json.JSONDecodeError) as e:
         print(f"Error fetching user bar for {username}: {e}")
-        return [
-            {"product": {"name": "Jameson", "proof": 80, "average_msrp": 30, "brand": "Jameson", "spirit": "whiskey"}}
-        ]
+        return None
+
+# Short-lived caches: users who just hit /personalized-recommendations are
+# often pulled into a room moments later, so reuse their analyzed profile and
+# the deterministic prefilter output instead of refetching and rescoring.
+_profile_cache = TTLCache(maxsize=10_000, ttl=300)
+_profile_locks = {}
+_candidate_cache = TTLCache(maxsize=1024, ttl=300)
+
+# Pipeline inputs collapse to a handful of equivalence classes (favorite
+# spirit x 5-point ABV bucket), so the formatted LLM output itself is highly
+# reusable. Hits skip every GPT call.
+_template_cache = TTLCache(maxsize=1024, ttl=3600)
+
+def _template_key(favorite_spirit, avg_abv):
+    return (favorite_spirit.lower(), int(avg_abv) // 5)
+
+async def get_user_profile(username: str):
+    """Fetch and analyze a user's bar, cached per username with single-flight
+    locking so concurrent requests for the same user share one fetch."""
+    profile = _profile_cache.get(username)
+    if profile is not None:
+        return profile
+    lock = _profile_locks.setdefault(username, asyncio.Lock())
+    try:
+        async with lock:
+            profile = _profile_cache.get(username)
+            if profile is None:
+                user_data = await fetch_user_bar(username)
+                # Bar analysis is pure CPU; keep it off the event loop so other
+                # requests progress while a large bar is crunched.
+                profile = await asyncio.to_thread(
+                    analyze_user_bar,
+                    user_data if user_data is not None else _FALLBACK_USER_BAR)
+                # Only pin real bar data: a failed fetch serves the fallback
+                # once and retries on the next request instead of caching it.
+                if user_data is not None:
+                    _profile_cache[username] = profile
+            return profile
+    finally:
+        # Drop the lock entry once free so the dict doesn't grow with every
+        # username ever seen; pending waiters keep their own reference.
+        if not lock.locked():
+            _profile_locks.pop(username, None)
+
+async def get_candidate_bottles(dataset, favorite_spirit, avg_abv, max_candidates=20):
+    """Prefilter candidates, memoized by spirit and rounded ABV. TTLCache is
+    not thread-safe, so the cache is only touched on the event loop and just
+    the pure scoring is offloaded to a thread."""
+    key = (favorite_spirit.lower(), round(avg_abv), max_candidates)
+    candidates = _candidate_cache.get(key)
+    if candidates is None:
+        candidates = await asyncio.to_thread(
+            prefilter_liquors, dataset, favorite_spirit, avg_abv, max_candidates)
+        _candidate_cache[key] = candidates
+    return candidates
 
 async def aggregate_profiles(profiles: list[dict]):
     """Aggregate multiple user profiles into a combined profile."""
@@ -165,8 +347,8 @@ async def aggregate_profiles(profiles: list[dict]):
     for profile in profiles:
         all_spirits.extend(profile['favorite_spirits'])
     
-    spirit_counts = {spirit: all_spirits.count(spirit) for spirit in set(all_spirits)}
-    favorite_spirit = max(spirit_counts.items(), key=lambda x: x[1])[0] if spirit_counts else "whiskey"
+    spirit_counts = Counter(all_spirits)
+    favorite_spirit = spirit_counts.most_common(1)[0][0] if spirit_counts else "whiskey"
     
     avg_abvs = [profile['avg_proof'] / 2 for profile in profiles]
     avg_abv = sum(avg_abvs) / len(avg_abvs) if avg_abvs else 40.0
@@ -181,117 +363,123 @@ async def aggregate_profiles(profiles: list[dict]):
         'favorite_spirits': [favorite_spirit]
     }
 
-async def find_influential_user(bottle: dict, profiles: list[dict], usernames: list[str]):
-    """Determine which user's profile most influenced a bottle recommendation."""
-    bottle_spirit = bottle.get('spirit_type', '').lower()
-    bottle_abv = float(bottle.get('abv', 0))
-    
-    max_score = -1
-    influential_user = usernames[0]
-    
-    for profile, username in zip(profiles, usernames):
-        score = 0
-        favorite_spirit = profile['favorite_spirits'][0].lower() if profile['favorite_spirits'] else ''
-        avg_abv = profile['avg_proof'] / 2
-        
-        if bottle_spirit == favorite_spirit:
-            score += 3
-        if abs(bottle_abv - avg_abv) <= 5:
-            score += 2
-            
-        if score > max_score:
-            max_score = score
-            influential_user = username
-    
-    return influential_user
+def find_influential_users(bottles: list[dict], profiles: list[dict], usernames: list[str]):
+    """Determine which user's profile most influenced each recommended bottle."""
+    # Stack the profile features once; each bottle is then scored against all
+    # users with two vectorized comparisons instead of a Python loop.
+    profile_spirits = np.asarray([
+        profile['favorite_spirits'][0].lower() if profile['favorite_spirits'] else ''
+        for profile in profiles
+    ])
+    profile_abvs = np.asarray([profile['avg_proof'] / 2 for profile in profiles],
+                              dtype=np.float32)
+
+    influential_users = []
+    for bottle in bottles:
+        bottle_spirit = str(bottle.get('spirit_type', '')).lower()
+        bottle_abv = float(bottle.get('abv', 0))
+        scores = (3 * (profile_spirits == bottle_spirit)
+                  + 2 * (np.abs(profile_abvs - bottle_abv) <= 5))
+        influential_users.append(usernames[int(np.argmax(scores))])
+
+    return influential_users
 
 async def run_recommendation_pipeline(username: str, dataset: list[dict], fast: FastAgent):
     """Run the recommendation pipeline for a single user."""
-    user_data = await fetch_user_bar(username)
-    user_profile = analyze_user_bar(user_data)
+    user_profile = await get_user_profile(username)
     favorite_spirit = user_profile['favorite_spirits'][0] if user_profile['favorite_spirits'] else "whiskey"
     avg_abv = user_profile['avg_proof'] / 2
-    
-    candidate_bottles = prefilter_liquors(dataset, favorite_spirit, avg_abv, max_candidates=20)
+
+    cache_key = _template_key(favorite_spirit, avg_abv)
+    formatted_results = _template_cache.get(cache_key)
+    if formatted_results is not None:
+        return formatted_results
+
+    candidate_bottles = await get_candidate_bottles(
+        dataset, favorite_spirit, avg_abv, max_candidates=20)
     if len(candidate_bottles) < 5:
         return {"error": f"Insufficient candidates ({len(candidate_bottles)}) for recommendations."}
-    
+
     async with fast.run() as agent:
-        profile_result = await agent.analyze_bar_profile(user_profile)
-        recommendations = await agent.enhanced_recommender(candidate_bottles, profile_result)
-        formatted_results = await agent.format_recommendations(recommendations)
-        return formatted_results
+        formatted_results = await _cached_agent_call(
+            "enhanced_recommender", agent.enhanced_recommender, candidate_bottles,
+            user_profile, parse=parse_recommendations)
+    _template_cache[cache_key] = formatted_results
+    return formatted_results
 
 async def run_room_recommendation_pipeline(usernames: list[str], dataset: list[dict], fast: FastAgent):
     """Run the recommendation pipeline for multiple users."""
-    user_profiles = []
-    for username in usernames:
-        user_data = await fetch_user_bar(username)
-        profile = analyze_user_bar(user_data)
-        user_profiles.append(profile)
+    # Fetch all user bars concurrently, capped so we don't hammer the BAXUS API.
+    semaphore = asyncio.Semaphore(10)
+
+    async def profile_with_limit(username):
+        async with semaphore:
+            return await get_user_profile(username)
+
+    user_profiles = await asyncio.gather(*(profile_with_limit(u) for u in usernames))
     
     combined_profile = await aggregate_profiles(user_profiles)
     favorite_spirit = combined_profile['favorite_spirits'][0]
     avg_abv = combined_profile['avg_proof'] / 2
+
+    cache_key = _template_key(favorite_spirit, avg_abv)
+    formatted_results = _template_cache.get(cache_key)
+    if formatted_results is None:
+        candidate_bottles = await get_candidate_bottles(
+            dataset, favorite_spirit, avg_abv, max_candidates=20)
+        if len(candidate_bottles) < 5:
+            return {"error": f"Insufficient candidates ({len(candidate_bottles)}) for recommendations."}
+
+        async with fast.run() as agent:
+            formatted_results = await _cached_agent_call(
+                "enhanced_recommender", agent.enhanced_recommender, candidate_bottles,
+                combined_profile, parse=parse_recommendations)
+        _template_cache[cache_key] = formatted_results
     
-    candidate_bottles = prefilter_liquors(dataset, favorite_spirit, avg_abv, max_candidates=20)
-    if len(candidate_bottles) < 5:
-        return {"error": f"Insufficient candidates ({len(candidate_bottles)}) for recommendations."}
-    
-    async with fast.run() as agent:
-        profile_result = await agent.analyze_bar_profile(combined_profile)
-        recommendations = await agent.enhanced_recommender(candidate_bottles, profile_result)
-        formatted_results = await agent.format_recommendations(recommendations)
-    
-    influenced_by = []
-    for bottle in formatted_results['bottles']:
-        bottle_info = next((item for item in dataset if item['name'] == bottle['name']), {})
-        influential_user = await find_influential_user(bottle_info, user_profiles, usernames)
-        influenced_by.append({"bottle": bottle['name'], "influenced_by": influential_user})
-    
+    name_to_row = _liquor_columns(dataset)[5]
+    bottle_infos = [name_to_row.get(bottle['name'], {}) for bottle in formatted_results['bottles']]
+    influential_users = find_influential_users(bottle_infos, user_profiles, usernames)
+    influenced_by = [
+        {"bottle": bottle['name'], "influenced_by": influential_user}
+        for bottle, influential_user in zip(formatted_results['bottles'], influential_users)
+    ]
+
     return {
         "bottles": formatted_results['bottles'],
         "influenced_by": influenced_by
     }
 
-# Flask Endpoints
-@app.route('/personalized-recommendations', methods=['POST'])
-def personalized_recommendations():
+# Request bodies
+class PersonalizedRequest(BaseModel):
+    username: str | None = None
+
+class RoomRequest(BaseModel):
+    usernames: list[str] | None = None
+
+# FastAPI Endpoints
+@app.post('/personalized-recommendations')
+async def personalized_recommendations(payload: PersonalizedRequest):
     """Endpoint for personalized liquor recommendations."""
-    data = request.get_json()
-    username = data.get('username')
-    if not username:
-        return jsonify({"error": "Username is required."}), 400
-    
+    if not payload.username:
+        return ORJSONResponse({"error": "Username is required."}, status_code=400)
+
     dataset = load_liquor_dataset()
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
     try:
-        result = loop.run_until_complete(run_recommendation_pipeline(username, dataset, fast))
-        return jsonify(result)
+        return await run_recommendation_pipeline(payload.username, dataset, fast)
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
-    finally:
-        loop.close()
+        return ORJSONResponse({"error": str(e)}, status_code=500)
 
-@app.route('/room-recommendations', methods=['POST'])
-def room_recommendations():
+@app.post('/room-recommendations')
+async def room_recommendations(payload: RoomRequest):
     """Endpoint for room-based liquor recommendations."""
-    data = request.get_json()
-    usernames = data.get('usernames')
-    if not usernames or not isinstance(usernames, list) or len(usernames) < 1:
-        return jsonify({"error": "At least one username is required as a list."}), 400
-    
+    if not payload.usernames or len(payload.usernames) < 1:
+        return ORJSONResponse({"error": "At least one username is required as a list."}, status_code=400)
+
     dataset = load_liquor_dataset()
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
     try:
-        result = loop.run_until_complete(run_room_recommendation_pipeline(usernames, dataset, fast))
-        return jsonify(result)
+        return await run_room_recommendation_pipeline(payload.usernames, dataset, fast)
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
-    finally:
-        loop.close()
+        return ORJSONResponse({"error": str(e)}, status_code=500)
 
 if __name__ == "__main__":
-    app.run(host="0.0.0.0", port=8000, debug=False)
\ No newline at end of file
+    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
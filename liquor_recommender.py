@@ -1,6 +1,7 @@
 import asyncio
 import csv
 import json
+from collections import Counter
 import requests
 import sys
 import os
@@ -56,21 +57,16 @@ def analyze_user_bar(user_bar):
     min_price = min(prices)
     max_price = max(prices)
     
-    spirit_counts = {}
-    spirit_counts = {spirit: spirit_counts.get(spirit, 0) + 1 for spirit in spirits}
-    brand_counts = {}
-    brand_counts = {brand: brand_counts.get(brand, 0) + 1 for brand in brands}
-    
-    favorite_spirits = sorted(spirit_counts.items(), key=lambda x: x[1], reverse=True)
-    favorite_brands = sorted(brand_counts.items(), key=lambda x: x[1], reverse=True)
-    
+    spirit_counts = Counter(spirits)
+    brand_counts = Counter(brands)
+
     return {
         'avg_proof': avg_proof,
         'proof_range': [min_proof, max_proof],
         'price_range': [min_price, max_price],
         'spirits': list(spirit_counts.keys()),
-        'favorite_spirits': [s[0] for s in favorite_spirits],
-        'favorite_brands': [b[0] for b in favorite_brands]
+        'favorite_spirits': [spirit for spirit, _ in spirit_counts.most_common()],
+        'favorite_brands': [brand for brand, _ in brand_counts.most_common()]
     }
 
 def prefilter_liquors(dataset, favorite_spirit, target_abv, max_candidates=20):